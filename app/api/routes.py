@@ -1,11 +1,15 @@
-from typing import List
+import asyncio
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.config import settings
 from app.database.connection import get_db
-from app.models.synonym import SynonymResponse
+from app.models.synonym import StatsResponse, SynonymResponse
+from app.services.resilience import ServiceUnavailableError
 from app.services.synonym_service import SynonymService
 
 router = APIRouter()
@@ -20,8 +24,79 @@ def get_info():
     }
 
 
+@router.get("/stats", response_model=StatsResponse)
+def get_stats():
+    """Cache state, TTL, record count and hit ratio without the synonym payload."""
+    return SynonymService.get_stats()
+
+
+@router.get("/stats/stream")
+async def stream_stats(
+    request: Request,
+    interval: float = Query(1.0, ge=0.5, le=60),
+    max_events: Optional[int] = Query(None, ge=1),
+):
+    """
+    Server-Sent Events stream pushing a stats snapshot every interval seconds.
+
+    Runs until the client disconnects, or until max_events have been sent.
+    """
+
+    async def events():
+        sent = 0
+        while not await request.is_disconnected():
+            # Redis calls block, so keep them off the event loop
+            stats = await run_in_threadpool(SynonymService.get_stats)
+            yield f"event: stats\ndata: {stats.model_dump_json()}\n\n"
+            sent += 1
+            if max_events is not None and sent >= max_events:
+                break
+            await asyncio.sleep(interval)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.delete("/cache")
+def invalidate_cache():
+    """Drop the cached dataset so the next request reloads it from the DB."""
+    SynonymService.invalidate()
+    return {"status": "invalidated"}
+
+
 @router.get("/synonyms", response_model=List[SynonymResponse])
-def get_synonyms(db: Session = Depends(get_db)):
-    """Get all synonyms with cache metadata showing hits/misses."""
+def get_synonyms(
+    response: Response,
+    search: Optional[str] = None,
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1),
+    db: Session = Depends(get_db),
+):
+    """
+    Get synonyms with cache metadata showing hits/misses.
+
+    Returns everything by default. Pass search/offset/limit to get one page,
+    the number of matches is in the X-Total-Count header. X-Cache-Status and
+    X-Response-Time-Ms carry the cache outcome even when the page is empty.
+    """
     service = SynonymService(db)
-    return service.get_all()
+    try:
+        page, total, metadata = service.search(search, offset, limit)
+    except ServiceUnavailableError as e:
+        # Fail fast so clients back off instead of piling up behind the DB
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": e.retry_after_header},
+        )
+    if metadata.stale:
+        cache_status = "STALE"
+    else:
+        cache_status = "HIT" if metadata.from_cache else "MISS"
+    response.headers["X-Total-Count"] = str(total)
+    response.headers["X-Cache-Status"] = cache_status
+    response.headers["X-Response-Time-Ms"] = f"{metadata.response_time_ms:.2f}"
+    return page
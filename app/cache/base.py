@@ -20,11 +20,31 @@ class CacheStrategy(ABC):
         """Remove key from cache."""
         pass
 
+    @abstractmethod
+    def incr(self, key: str) -> int:
+        """Atomically increment a counter (starting from 0) that never expires."""
+        pass
+
+    @abstractmethod
+    def set_max(self, key: str, value: int, ttl: int) -> int:
+        """
+        Atomically store value only if it's higher than the current value.
+
+        Returns the value the key holds afterwards, which is the current one
+        when value wasn't higher. A missing or expired key always takes value.
+        """
+        pass
+
     @abstractmethod
     def exists(self, key: str) -> bool:
         """Check if key exists and hasn't expired."""
         pass
 
+    @abstractmethod
+    def ttl(self, key: str) -> Optional[float]:
+        """Seconds until key expires, None if missing or it never expires."""
+        pass
+
     @abstractmethod
     def get_info(self) -> Any:
         """Return metadata about the cache backend."""
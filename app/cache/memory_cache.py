@@ -38,6 +38,26 @@ class MemoryCache(CacheStrategy):
         with self._lock:
             self._data.pop(key, None)
 
+    def incr(self, key: str) -> int:
+        """Increment under the lock. Counters are stored without expiry."""
+        with self._lock:
+            value, _ = self._data.get(key, (0, None))
+            value += 1
+            self._data[key] = (value, float("inf"))
+            return value
+
+    def set_max(self, key: str, value: int, ttl: int) -> int:
+        """Compare and set under the lock."""
+        now = time.time()
+        with self._lock:
+            if key in self._data:
+                current, expires_at = self._data[key]
+                if now <= expires_at and current >= value:
+                    return current
+
+            self._data[key] = (value, now + ttl)
+            return value
+
     def exists(self, key: str) -> bool:
         """Check if key exists and is still valid."""
         with self._lock:
@@ -52,5 +72,22 @@ class MemoryCache(CacheStrategy):
 
             return True
 
+    def ttl(self, key: str) -> Optional[float]:
+        """Remaining lifetime, auto-deletes if expired."""
+        with self._lock:
+            if key not in self._data:
+                return None
+
+            _, expires_at = self._data[key]
+            remaining = expires_at - time.time()
+
+            if remaining <= 0:
+                del self._data[key]
+                return None
+            if remaining == float("inf"):
+                return None
+
+            return remaining
+
     def get_info(self) -> CacheInfo:
         return CacheInfo(cache_source="memory")
@@ -7,6 +7,17 @@ from app.cache.base import CacheStrategy
 from app.config import settings
 from app.models.synonym import CacheInfo
 
+# Compare and set in one round trip, Redis runs scripts atomically
+SET_MAX_SCRIPT = """
+local current = tonumber(redis.call('GET', KEYS[1]))
+local value = tonumber(ARGV[1])
+if current ~= nil and current >= value then
+    return current
+end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+return value
+"""
+
 
 class RedisCache(CacheStrategy):
     """Distributed cache using Redis with JSON serialization."""
@@ -18,6 +29,7 @@ class RedisCache(CacheStrategy):
             db=settings.redis_db,
             decode_responses=True,
         )
+        self._set_max = self.redis.register_script(SET_MAX_SCRIPT)
         self.host = settings.redis_host
         self.port = settings.redis_port
 
@@ -36,10 +48,25 @@ class RedisCache(CacheStrategy):
     def delete(self, key: str) -> None:
         self.redis.delete(key)
 
+    def incr(self, key: str) -> int:
+        """INCR is atomic across all app instances sharing this Redis."""
+        return self.redis.incr(key)
+
+    def set_max(self, key: str, value: int, ttl: int) -> int:
+        """Values are JSON, and a JSON integer is a plain number for Lua too."""
+        return int(self._set_max(keys=[key], args=[json.dumps(value), ttl]))
+
     def exists(self, key: str) -> bool:
         """Check existence (returns count, so we check > 0)."""
         return self.redis.exists(key) > 0
 
+    def ttl(self, key: str) -> Optional[float]:
+        """PTTL returns -2 for missing keys and -1 for keys without expiry."""
+        remaining_ms = self.redis.pttl(key)
+        if remaining_ms < 0:
+            return None
+        return remaining_ms / 1000
+
     def get_info(self) -> CacheInfo:
         return CacheInfo(
             cache_source="redis",
@@ -1,5 +1,7 @@
 from enum import Enum
+from typing import List, Optional
 
+from pydantic import model_validator
 from pydantic_settings import BaseSettings
 
 
@@ -10,15 +12,29 @@ class CacheStrategy(str, Enum):
     MEMORY = "memory"
 
 
+class DatabaseBackend(str, Enum):
+    """Where SynonymRepository reads from."""
+
+    MSSQL = "mssql"
+    SQLITE = "sqlite"
+
+
 class Settings(BaseSettings):
     """App config loaded from environment variables."""
 
-    database_server: str
-    database_port: int
-    database_name: str
-    database_user: str
-    database_password: str
-    database_driver: str
+    database_backend: DatabaseBackend = DatabaseBackend.MSSQL
+
+    # SQL Server connection, required unless running on the SQLite backend
+    database_server: Optional[str] = None
+    database_port: Optional[int] = None
+    database_name: Optional[str] = None
+    database_user: Optional[str] = None
+    database_password: Optional[str] = None
+    database_driver: Optional[str] = None
+
+    # Embedded SQLite copy for edge nodes, filled by app.database.sync
+    sqlite_path: str = "data/synonyms.db"
+    sqlite_mmap_size: int = 268435456  # 256MB, more than enough for the table
 
     redis_host: str
     redis_port: int
@@ -27,11 +43,55 @@ class Settings(BaseSettings):
     cache_strategy: CacheStrategy
     cache_ttl: int
 
+    # Load shedding and circuit breaking for database-bound work
+    db_max_concurrency: int = 10
+    db_queue_timeout: float = 1.0
+    breaker_failure_threshold: int = 5
+    breaker_reset_timeout: float = 30.0
+
     class Config:
         case_sensitive = False
 
+    @model_validator(mode="after")
+    def check_mssql_settings(self):
+        """SQL Server settings are only optional on the SQLite backend."""
+        if self.database_backend == DatabaseBackend.MSSQL:
+            missing = self.missing_mssql_settings()
+            if missing:
+                raise ValueError(
+                    f"Missing SQL Server settings for mssql backend: {missing}"
+                )
+        return self
+
+    def missing_mssql_settings(self) -> List[str]:
+        """Names of SQL Server settings that aren't set."""
+        return [
+            name
+            for name in (
+                "database_server",
+                "database_port",
+                "database_name",
+                "database_user",
+                "database_password",
+                "database_driver",
+            )
+            if getattr(self, name) is None
+        ]
+
     @property
     def database_url(self):
+        """Builds the SQLAlchemy connection URL for the configured backend."""
+        if self.database_backend == DatabaseBackend.SQLITE:
+            return self.sqlite_url
+        return self.mssql_url
+
+    @property
+    def sqlite_url(self):
+        """Read-only URL for the embedded SQLite copy."""
+        return f"sqlite:///file:{self.sqlite_path}?mode=ro&uri=true"
+
+    @property
+    def mssql_url(self):
         """Builds the SQLAlchemy connection URL for SQL Server."""
         driver = self.database_driver.replace(" ", "+")
         return (
@@ -1,14 +1,43 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
-from app.config import settings
+from app.config import DatabaseBackend, settings
 
-engine = create_engine(
-    settings.database_url,
-    pool_size=10,  # Base pool size
-    max_overflow=20,  # Extra connections allowed under load
-    pool_pre_ping=True,  # Test connection before use (handles disconnects)
-)
+
+def create_sqlite_engine():
+    """
+    Engine for the embedded SQLite copy.
+
+    Connections are read-only and memory-mapped, so cache misses are served
+    from local pages. The sync job keeps the file in WAL mode, which lets it
+    swap in a new dataset while readers keep seeing a consistent snapshot.
+    """
+    engine = create_engine(settings.sqlite_url, pool_pre_ping=True)
+
+    @event.listens_for(engine, "connect")
+    def _configure(dbapi_connection, _):
+        cursor = dbapi_connection.cursor()
+        cursor.execute(f"PRAGMA mmap_size={settings.sqlite_mmap_size}")
+        cursor.execute("PRAGMA query_only=ON")
+        cursor.close()
+
+    return engine
+
+
+def create_mssql_engine():
+    """Engine for the remote SQL Server."""
+    return create_engine(
+        settings.mssql_url,
+        pool_size=10,  # Base pool size
+        max_overflow=20,  # Extra connections allowed under load
+        pool_pre_ping=True,  # Test connection before use (handles disconnects)
+    )
+
+
+if settings.database_backend == DatabaseBackend.SQLITE:
+    engine = create_sqlite_engine()
+else:
+    engine = create_mssql_engine()
 
 SessionLocal = sessionmaker(bind=engine)
 
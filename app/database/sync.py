@@ -0,0 +1,73 @@
+"""
+Exports the synonyms table from SQL Server into the embedded SQLite copy.
+
+Run on a schedule on edge nodes:
+
+    python -m app.database.sync
+"""
+
+import logging
+import os
+import sys
+
+from sqlalchemy import create_engine, delete, insert
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database.connection import create_mssql_engine
+from app.database.repository import SynonymRepository
+from app.models.synonym import Synonym
+
+logger = logging.getLogger(__name__)
+
+
+def create_sqlite_writer():
+    """Writable engine for the sync job. The app itself only opens it read-only."""
+    directory = os.path.dirname(settings.sqlite_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    return create_engine(f"sqlite:///{settings.sqlite_path}")
+
+
+def sync() -> int:
+    """Copy all synonyms into SQLite in one transaction, returns the row count."""
+    # Edge nodes run on the sqlite backend, where these are allowed to be unset
+    missing = settings.missing_mssql_settings()
+    if missing:
+        raise ValueError(f"Sync needs SQL Server settings, missing: {missing}")
+
+    with Session(create_mssql_engine()) as source:
+        rows = [
+            {"word_id": s.word_id, "word": s.word, "synonyms": s.synonyms}
+            for s in SynonymRepository(source).get_all()
+        ]
+
+    target = create_sqlite_writer()
+    with target.connect() as conn:
+        # WAL is persistent, so readers opened with mode=ro pick it up too
+        conn.exec_driver_sql("PRAGMA journal_mode=WAL")
+    Synonym.__table__.create(target, checkfirst=True)
+
+    # Replace the whole table atomically, readers keep their old snapshot
+    # until the commit and never see a half-written dataset
+    with target.begin() as conn:
+        conn.execute(delete(Synonym.__table__))
+        if rows:
+            conn.execute(insert(Synonym.__table__), rows)
+
+    target.dispose()
+    return len(rows)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(levelname)s:     %(message)s",
+        handlers=[logging.StreamHandler(sys.stdout)],
+    )
+    try:
+        count = sync()
+    except ValueError as e:
+        logger.error(e)
+        sys.exit(1)
+    logger.info(f"Synced {count} synonyms to {settings.sqlite_path}")
@@ -26,6 +26,7 @@ class CacheMetadata(BaseModel):
     """Metadata indicating whether response came from cache or database."""
 
     from_cache: bool
+    stale: bool = False  # True when served from last known good data during an outage
     cache_info: Optional[CacheInfo] = None
     response_time_ms: float
 
@@ -37,3 +38,19 @@ class SynonymResponse(BaseModel):
     word: str
     synonyms: str
     cache_metadata: CacheMetadata
+
+
+class StatsResponse(BaseModel):
+    """Cheap summary of cache state, without the synonym payload."""
+
+    cache_strategy: str
+    cache_state: str  # "warm" if a dataset is cached, otherwise "empty"
+    cache_ttl_seconds: int
+    ttl_remaining_seconds: Optional[float] = None
+    record_count: Optional[int] = None
+    data_version: Optional[int] = None  # Cache generation currently served
+    hits: int
+    stale_hits: int  # Served from last known good data while the DB was down
+    misses: int
+    hit_ratio: float  # Share of requests answered from cache, stale included
+    circuit_state: str
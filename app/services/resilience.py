@@ -0,0 +1,166 @@
+import math
+import time
+from contextlib import contextmanager
+from enum import Enum
+from threading import BoundedSemaphore, Lock
+from typing import Any, Callable
+
+from app.config import settings
+
+
+class ServiceUnavailableError(Exception):
+    """Raised when a request is rejected instead of being sent to the database."""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+    @property
+    def retry_after_header(self) -> str:
+        """Retry-After needs whole seconds, so round up."""
+        return str(max(1, math.ceil(self.retry_after)))
+
+
+class ServiceOverloadedError(ServiceUnavailableError):
+    """Raised when a request waited too long for a database slot."""
+
+
+class CircuitOpenError(ServiceUnavailableError):
+    """Raised when the circuit breaker is open and the database is skipped."""
+
+
+class AdmissionController:
+    """
+    Caps how many requests can do database work at the same time.
+
+    Requests that can't get a slot within queue_timeout are shed right away
+    instead of holding a worker thread while they wait for the pool.
+    """
+
+    def __init__(self, max_concurrent: int, queue_timeout: float):
+        self.max_concurrent = max_concurrent
+        self.queue_timeout = queue_timeout
+        self._slots = BoundedSemaphore(max_concurrent)
+
+    @contextmanager
+    def admit(self):
+        """Hold a slot for the duration of the block, or raise if none frees up."""
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            raise ServiceOverloadedError(
+                f"No database slot available within {self.queue_timeout}s",
+                retry_after=self.queue_timeout,
+            )
+        try:
+            yield
+        finally:
+            self._slots.release()
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker around database calls.
+
+    After failure_threshold consecutive failures the circuit opens and calls
+    fail fast for reset_timeout seconds. Then a single trial call is let
+    through (half-open): success closes the circuit, failure re-opens it.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> CircuitState:
+        """Call with the lock held. Moves OPEN to HALF_OPEN once cooled down."""
+        if (
+            self._state == CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self.reset_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._trial_in_flight = False
+        return self._state
+
+    def _retry_after(self) -> float:
+        return max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+
+    def allow_request(self) -> bool:
+        """Check if a call may go through right now."""
+        with self._lock:
+            state = self._current_state()
+            if state == CircuitState.CLOSED:
+                return True
+            if state == CircuitState.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def raise_if_open(self) -> None:
+        """Fail fast while open, without using up the half-open trial call."""
+        with self._lock:
+            if self._current_state() != CircuitState.OPEN:
+                return
+            retry_after = self._retry_after()
+        raise CircuitOpenError(
+            "Database circuit breaker is open", retry_after=retry_after
+        )
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = CircuitState.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if (
+                self._state == CircuitState.HALF_OPEN
+                or self._failures >= self.failure_threshold
+            ):
+                self._state = CircuitState.OPEN
+                self._opened_at = time.monotonic()
+                self._trial_in_flight = False
+
+    def call(self, func: Callable[[], Any]) -> Any:
+        """Run func through the breaker, raising CircuitOpenError if it's open."""
+        if not self.allow_request():
+            with self._lock:
+                retry_after = self._retry_after()
+            raise CircuitOpenError(
+                "Database circuit breaker is open", retry_after=retry_after
+            )
+        try:
+            result = func()
+        except Exception:
+            self.record_failure()
+            raise
+        self.record_success()
+        return result
+
+
+# Shared across requests, like the engine's connection pool
+db_admission = AdmissionController(
+    max_concurrent=settings.db_max_concurrency,
+    queue_timeout=settings.db_queue_timeout,
+)
+db_breaker = CircuitBreaker(
+    failure_threshold=settings.breaker_failure_threshold,
+    reset_timeout=settings.breaker_reset_timeout,
+)
@@ -1,6 +1,7 @@
 import logging
 import time
-from typing import List
+from threading import Lock
+from typing import List, Optional, Tuple
 
 from colorama import Fore, Style
 from sqlalchemy.orm import Session
@@ -8,34 +9,109 @@ from sqlalchemy.orm import Session
 from app.cache.factory import CacheFactory
 from app.config import settings
 from app.database.repository import SynonymRepository
-from app.models.synonym import CacheMetadata, SynonymResponse
+from app.models.synonym import (
+    CacheInfo,
+    CacheMetadata,
+    StatsResponse,
+    SynonymResponse,
+)
+from app.services.resilience import (
+    ServiceOverloadedError,
+    db_admission,
+    db_breaker,
+)
 
 # Setting up the logger
 logger = logging.getLogger(__name__)
 
+# Each dataset load is written under its own generation, then this pointer is
+# flipped to it in a single write, so readers never see a mix of two loads.
+# Generations are numbered when a load starts, so the pointer only ever moves
+# to a load that started later than the one it replaces.
+CURRENT_GENERATION_KEY = "synonyms:current"
+GENERATION_COUNTER_KEY = "synonyms:generation"
+INVALIDATED_GENERATION_KEY = "synonyms:invalidated"
+GENERATION_ENTRIES = ("all", "count")  # Written per generation
+
+# Generation data outlives the pointer a little, so a reader that fetched the
+# pointer just before it expired can still read the data it points to
+GENERATION_GRACE_SECONDS = 5
+
+# Loads that started before an invalidation are discarded for this long,
+# which is well past how long any single query can take
+INVALIDATION_FLOOR_TTL = 24 * 60 * 60
+
+
+def generation_key(generation: int, name: str = "all") -> str:
+    """Cache key for one entry of a dataset generation."""
+    return f"synonyms:v{generation}:{name}"
+
 
 class SynonymService:
     """Handles synonym retrieval with caching."""
 
+    # Last dataset we successfully served, kept past its TTL so we can
+    # keep answering (flagged as stale) while the database is unavailable
+    _last_known_good: Optional[List[dict]] = None
+    _last_known_good_lock = Lock()
+
+    # Per-process counters for the stats endpoint, recorded once a request
+    # has been answered: fresh cache hits, stale fallbacks and DB loads
+    _hits = 0
+    _stale_hits = 0
+    _misses = 0
+    _stats_lock = Lock()
+
     def __init__(self, session: Session):
         self.repo = SynonymRepository(session)
         self.cache = CacheFactory.get_cache()
 
     def get_all(self) -> List[SynonymResponse]:
         """Get all synonyms, checking cache before hitting the database."""
+        data, metadata = self._load()
+        return [SynonymResponse(**item, cache_metadata=metadata) for item in data]
+
+    def search(
+        self, term: Optional[str] = None, offset: int = 0, limit: Optional[int] = None
+    ) -> Tuple[List[SynonymResponse], int, CacheMetadata]:
+        """
+        Filter by word and return one page, the total number of matches and
+        the cache metadata, which is still available when the page is empty.
+
+        Only the requested page is turned into response models, so clients
+        don't have to pull the whole table to show a slice of it.
+        """
+        data, metadata = self._load()
+        if term:
+            term = term.lower()
+            data = [item for item in data if term in item["word"].lower()]
+
+        total = len(data)
+        end = None if limit is None else offset + limit
+        page = [
+            SynonymResponse(**item, cache_metadata=metadata)
+            for item in data[offset:end]
+        ]
+        return page, total, metadata
+
+    def _load(self) -> Tuple[List[dict], CacheMetadata]:
+        """Get the dataset from cache, the database, or the last known good copy."""
         start = time.time()
-        cache_key = "synonyms:all"
         cache_info = self.cache.get_info()
         cache_source = cache_info.cache_source.upper()
 
         # Try cache first, but fall back to DB if it fails
         cached = None
         try:
-            cached = self.cache.get(cache_key)
+            generation = self.cache.get(CURRENT_GENERATION_KEY)
+            if generation:
+                cached = self.cache.get(generation_key(generation))
         except Exception as e:
             logger.warning(f"Cache get failed: {e}")
 
         if cached:
+            self._remember(cached)
+            self._record("hit")
             elapsed = (time.time() - start) * 1000
             logger.info(
                 f"{Fore.GREEN}[CACHE HIT - {cache_source}]{Style.RESET_ALL} "
@@ -45,14 +121,33 @@ class SynonymService:
             metadata = CacheMetadata(
                 from_cache=True, cache_info=cache_info, response_time_ms=elapsed
             )
-            return [SynonymResponse(**item, cache_metadata=metadata) for item in cached]
+            return cached, metadata
 
         logger.info(
             f"{Fore.YELLOW}[CACHE MISS - {cache_source}]{Style.RESET_ALL} "
             f"Querying database..."
         )
 
-        synonyms = self.repo.get_all()
+        # Skip the DB entirely while it's failing, before queueing for a slot,
+        # so an open breaker serves last known good data at cache speed
+        try:
+            db_breaker.raise_if_open()
+            with db_admission.admit():
+                generation = self._reserve_generation()
+                synonyms = db_breaker.call(self.repo.get_all)
+        except ServiceOverloadedError:
+            logger.warning(
+                f"{Fore.MAGENTA}[SHED]{Style.RESET_ALL} "
+                f"No database slot free, rejecting request"
+            )
+            raise
+        except Exception as e:
+            stale = self._get_last_known_good()
+            if stale is None:
+                raise
+            logger.warning(f"Database unavailable, serving stale data: {e}")
+            self._record("stale")
+            return self._stale_response(stale, start, cache_info)
 
         # Convert to dicts to avoid SQLAlchemy serialization issues
         data = [
@@ -64,11 +159,18 @@ class SynonymService:
             for s in synonyms
         ]
 
-        # Try to cache for next time, but don't fail the request if caching fails
-        try:
-            self.cache.set(cache_key, data, settings.cache_ttl)
-        except Exception as e:
-            logger.warning(f"Cache set failed: {e}")
+        # Try to cache for next time, but don't fail the request if caching fails.
+        # A load that lost to a newer or invalidating one still answers this
+        # request, but doesn't become the stale fallback
+        published = True
+        if generation is not None:
+            try:
+                published = self._publish(generation, data)
+            except Exception as e:
+                logger.warning(f"Cache set failed: {e}")
+        if published:
+            self._remember(data)
+        self._record("miss")
 
         elapsed = (time.time() - start) * 1000
         logger.info(
@@ -77,4 +179,139 @@ class SynonymService:
         )
 
         metadata = CacheMetadata(from_cache=False, response_time_ms=elapsed)
-        return [SynonymResponse(**item, cache_metadata=metadata) for item in data]
+        return data, metadata
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """
+        Drop the current dataset, whatever its size.
+
+        Points readers at a fresh, empty generation, so they miss right away
+        and any load that started earlier loses the pointer flip. The floor
+        keeps those loads out even after the pointer has expired.
+        """
+        cache = CacheFactory.get_cache()
+        generation = cache.incr(GENERATION_COUNTER_KEY)
+        cache.set_max(CURRENT_GENERATION_KEY, generation, settings.cache_ttl)
+        cache.set_max(INVALIDATED_GENERATION_KEY, generation, INVALIDATION_FLOOR_TTL)
+
+    def _reserve_generation(self) -> Optional[int]:
+        """Number this load before querying, None if the cache is unavailable."""
+        try:
+            return self.cache.incr(GENERATION_COUNTER_KEY)
+        except Exception as e:
+            logger.warning(f"Cache incr failed: {e}")
+            return None
+
+    def _publish(self, generation: int, data: List[dict]) -> bool:
+        """
+        Write data under its generation, then point readers at it.
+
+        Returns False if the data was discarded: a load that started later has
+        already been published, or the cache was invalidated after this load
+        started. The pointer only moves forward, so a slower load that read
+        older rows can't replace a newer one.
+        """
+        floor = self.cache.get(INVALIDATED_GENERATION_KEY)
+        if floor and generation <= floor:
+            return False
+
+        generation_ttl = settings.cache_ttl + GENERATION_GRACE_SECONDS
+        self.cache.set(generation_key(generation), data, generation_ttl)
+        self.cache.set(generation_key(generation, "count"), len(data), generation_ttl)
+        current = self.cache.set_max(
+            CURRENT_GENERATION_KEY, generation, settings.cache_ttl
+        )
+
+        # A newer load already won, nobody will ever read this generation
+        if current != generation:
+            self._delete_generation(generation)
+            return False
+
+        # Lazily clean up the generation before last. The previous one is kept
+        # for readers that resolved the old pointer a moment ago
+        if current > 2:
+            self._delete_generation(current - 2)
+        return True
+
+    def _delete_generation(self, generation: int) -> None:
+        for name in GENERATION_ENTRIES:
+            self.cache.delete(generation_key(generation, name))
+
+    @classmethod
+    def get_stats(cls) -> StatsResponse:
+        """Summarize cache state from a few small keys, never touching the DB."""
+        cache = CacheFactory.get_cache()
+        generation = ttl_remaining = record_count = None
+        try:
+            generation = cache.get(CURRENT_GENERATION_KEY)
+            if generation:
+                record_count = cache.get(generation_key(generation, "count"))
+            # An invalidated pointer leads to a generation with no data
+            if record_count is None:
+                generation = None
+            else:
+                ttl_remaining = cache.ttl(CURRENT_GENERATION_KEY)
+        except Exception as e:
+            logger.warning(f"Cache stats failed: {e}")
+
+        with cls._stats_lock:
+            hits, stale_hits, misses = cls._hits, cls._stale_hits, cls._misses
+
+        # Stale responses are served from cached data too, so they count
+        # towards the hit ratio instead of dragging it down during an outage
+        served_from_cache = hits + stale_hits
+        total = served_from_cache + misses
+
+        return StatsResponse(
+            cache_strategy=settings.cache_strategy.value,
+            cache_state="warm" if generation else "empty",
+            cache_ttl_seconds=settings.cache_ttl,
+            ttl_remaining_seconds=ttl_remaining,
+            record_count=record_count,
+            data_version=generation,
+            hits=hits,
+            stale_hits=stale_hits,
+            misses=misses,
+            hit_ratio=served_from_cache / total if total else 0.0,
+            circuit_state=db_breaker.state.value,
+        )
+
+    @classmethod
+    def _record(cls, outcome: str) -> None:
+        """Count an answered request as a "hit", "stale" or "miss"."""
+        with cls._stats_lock:
+            if outcome == "hit":
+                cls._hits += 1
+            elif outcome == "stale":
+                cls._stale_hits += 1
+            else:
+                cls._misses += 1
+
+    @classmethod
+    def _remember(cls, data: List[dict]) -> None:
+        with cls._last_known_good_lock:
+            cls._last_known_good = data
+
+    @classmethod
+    def _get_last_known_good(cls) -> Optional[List[dict]]:
+        with cls._last_known_good_lock:
+            return cls._last_known_good
+
+    def _stale_response(
+        self, data: List[dict], start: float, cache_info: CacheInfo
+    ) -> Tuple[List[dict], CacheMetadata]:
+        """Build a response from the last known good dataset."""
+        elapsed = (time.time() - start) * 1000
+        logger.info(
+            f"{Fore.MAGENTA}[STALE]{Style.RESET_ALL} "
+            f"Served last known good in {Fore.CYAN}{elapsed:.2f}ms{Style.RESET_ALL}"
+        )
+
+        metadata = CacheMetadata(
+            from_cache=True,
+            stale=True,
+            cache_info=cache_info,
+            response_time_ms=elapsed,
+        )
+        return data, metadata
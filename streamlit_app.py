@@ -1,34 +1,95 @@
+import json
+import math
 import time
-from datetime import datetime
 
 import requests
 import streamlit as st
 
 API_BASE_URL = "http://app:8000"
+PAGE_SIZES = [10, 25, 50, 100]
 
 
-def get_api_info():
+def get_stats():
     try:
-        response = requests.get(f"{API_BASE_URL}/api/info")
+        response = requests.get(f"{API_BASE_URL}/api/stats")
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
-        st.error(f"Failed to fetch API info: {e}")
+        st.error(f"Failed to fetch API stats: {e}")
         return None
 
 
-def get_synonyms():
+def stream_stats():
+    """Yield stats snapshots pushed by the API over Server-Sent Events."""
+    with requests.get(
+        f"{API_BASE_URL}/api/stats/stream", stream=True, timeout=(5, 30)
+    ) as response:
+        response.raise_for_status()
+        for line in response.iter_lines(decode_unicode=True):
+            if line and line.startswith("data:"):
+                yield json.loads(line[len("data:") :])
+
+
+def get_synonyms(search, offset, limit):
+    """
+    Fetch one page of synonyms, filtered server-side.
+
+    Returns the response, or None on failure. The page can be empty, so the
+    cache outcome is read from the response headers rather than the rows.
+    """
     try:
         start_time = time.time()
-        response = requests.get(f"{API_BASE_URL}/api/synonyms")
+        response = requests.get(
+            f"{API_BASE_URL}/api/synonyms",
+            params={"search": search or None, "offset": offset, "limit": limit},
+        )
         response.raise_for_status()
         elapsed_time = (time.time() - start_time) * 1000
-        return response.json(), elapsed_time
+        return response, elapsed_time
     except requests.exceptions.RequestException as e:
         st.error(f"Failed to fetch synonyms: {e}")
         return None, 0
 
 
+def render_stats(stats):
+    """Draw cache stats. Called once per rerun and again for each pushed update."""
+    if not stats:
+        return
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Cache Strategy", stats["cache_strategy"].upper())
+    with col2:
+        warm = stats["cache_state"] == "warm"
+        st.metric("Cache State", f"{'🟢' if warm else '⚪'} {stats['cache_state']}")
+    with col3:
+        record_count = stats.get("record_count")
+        st.metric("Records Cached", "N/A" if record_count is None else record_count)
+    with col4:
+        version = stats.get("data_version")
+        st.metric("Data Version", "N/A" if version is None else f"v{version}")
+
+    col5, col6, col7 = st.columns(3)
+    with col5:
+        st.metric(
+            "Hit Ratio",
+            f"{stats['hit_ratio']:.0%}",
+            help=(
+                f"{stats['hits']} hits / {stats['stale_hits']} stale / "
+                f"{stats['misses']} misses"
+            ),
+        )
+    with col6:
+        st.metric("DB Circuit", stats["circuit_state"].upper())
+    with col7:
+        remaining = stats.get("ttl_remaining_seconds")
+        if remaining:
+            st.metric("Time Until Expiry", f"{remaining:.1f}s")
+            st.progress(min(1.0, remaining / stats["cache_ttl_seconds"]))
+        else:
+            st.metric("Time Until Expiry", "Expired")
+
+
 def main():
     st.set_page_config(
         page_title="Synonym System Dashboard", page_icon="📚", layout="wide"
@@ -37,109 +98,115 @@ def main():
     st.title("Data Engine Synonym System")
     st.markdown("---")
 
-    if "last_miss_time" not in st.session_state:
-        st.session_state.last_miss_time = None
+    st.subheader("Cache Status")
+    live = st.toggle("Live updates", value=False)
+    stats_placeholder = st.empty()
+    with stats_placeholder.container():
+        render_stats(get_stats())
 
-    col1, col2 = st.columns([2, 1])
+    st.markdown("---")
+    st.subheader("Synonym Records")
+
+    def reset_page():
+        # The previous total was for another search or page size
+        st.session_state.page = 1
+        st.session_state.total = None
+
+    search_col, size_col, page_col = st.columns([3, 1, 1])
+    with search_col:
+        search_term = st.text_input("Search by word", "", on_change=reset_page)
+    with size_col:
+        page_size = st.selectbox("Page size", PAGE_SIZES, on_change=reset_page)
+    with page_col:
+        # Cap at the last page once a fetch has reported the total, clamping
+        # first since the widget rejects a stored value above max_value
+        page_count = None
+        if st.session_state.get("total") is not None:
+            page_count = max(1, math.ceil(st.session_state.total / page_size))
+            st.session_state.page = min(st.session_state.get("page", 1), page_count)
+        page = st.number_input("Page", min_value=1, max_value=page_count, key="page")
+
+    # Once fetched, keep showing the table: changing the search or page only
+    # pulls the matching page from the server, not the whole table
+    if st.button("Fetch Synonyms", type="primary", use_container_width=True):
+        st.session_state.fetched = True
 
-    with col1:
-        st.subheader("API Configuration")
-        info = get_api_info()
-        if info:
-            info_col1, info_col2 = st.columns(2)
-            with info_col1:
-                st.metric("Cache Strategy", info.get("cache_strategy", "N/A").upper())
-            with info_col2:
-                st.metric(
-                    "Cache TTL", f"{info.get('cache_ttl_seconds', 'N/A')} seconds"
-                )
+    if st.session_state.get("fetched"):
+        with st.spinner("Fetching data..."):
+            response, elapsed = get_synonyms(
+                search_term, (page - 1) * page_size, page_size
+            )
 
-    with col2:
-        if st.session_state.last_miss_time:
-            # Get TTL from API config instead of hardcoding
-            ttl_seconds = info.get("cache_ttl_seconds", 25) if info else 25
-            elapsed = (datetime.now() - st.session_state.last_miss_time).total_seconds()
-            remaining = max(0, ttl_seconds - elapsed)
-
-            if remaining > 0:
-                st.subheader("Cache Expiration Timer")
-                st.metric("Time Until Expiry", f"{remaining:.1f}s")
-                progress = remaining / ttl_seconds
-                st.progress(progress)
-            else:
-                st.subheader("Cache Status")
-                st.warning("Cache has expired")
+        if response is not None:
+            data = response.json()
+            total = int(response.headers.get("X-Total-Count", 0))
 
-    st.markdown("---")
+            st.session_state.total = total
 
-    if st.button("Fetch Synonyms", type="primary", use_container_width=True):
-        with st.spinner("Fetching data..."):
-            data, elapsed = get_synonyms()
-
-            if data:
-                st.success(f"Request completed in {elapsed:.2f}ms")
-
-                first_item = data[0] if data else {}
-                cache_metadata = first_item.get("cache_metadata", {})
-                from_cache = cache_metadata.get("from_cache", False)
-                cache_info = cache_metadata.get("cache_info")
-
-                metric_col1, metric_col2, metric_col3, metric_col4 = st.columns(4)
-
-                with metric_col1:
-                    cache_status = "HIT" if from_cache else "MISS"
-                    status_color = "🟢" if from_cache else "🔴"
-                    st.metric("Cache Status", f"{status_color} {cache_status}")
-
-                with metric_col2:
-                    if cache_info:
-                        source = cache_info.get("cache_source", "N/A").upper()
-                        st.metric("Cache Source", source)
-
-                with metric_col3:
-                    response_time = cache_metadata.get("response_time_ms", 0)
-                    st.metric("Response Time", f"{response_time:.2f}ms")
-
-                with metric_col4:
-                    st.metric("Records Retrieved", len(data))
-
-                if not from_cache:
-                    st.session_state.last_miss_time = datetime.now()
-
-                if cache_info and cache_info.get("cache_source") == "redis":
-                    redis_host = cache_info.get("redis_host")
-                    redis_port = cache_info.get("redis_port")
-                    st.info(f"Redis: {redis_host}:{redis_port}")
-
-                st.markdown("---")
-                st.subheader("Synonym Records")
-
-                search_term = st.text_input("Search by word", "")
-
-                filtered_data = data
-                if search_term:
-                    filtered_data = [
-                        item
-                        for item in data
-                        if search_term.lower() in item.get("word", "").lower()
-                    ]
-
-                st.dataframe(
-                    [
-                        {
-                            "ID": item.get("word_id"),
-                            "Word": item.get("word"),
-                            "Synonyms": item.get("synonyms"),
-                        }
-                        for item in filtered_data
-                    ],
-                    use_container_width=True,
-                    hide_index=True,
+            # The cache may have just been filled, so refresh the status panel
+            with stats_placeholder.container():
+                render_stats(get_stats())
+
+            st.success(f"Request completed in {elapsed:.2f}ms")
+
+            first_item = data[0] if data else {}
+            cache_info = first_item.get("cache_metadata", {}).get("cache_info")
+
+            metric_col1, metric_col2, metric_col3, metric_col4 = st.columns(4)
+
+            with metric_col1:
+                cache_status = response.headers.get("X-Cache-Status", "N/A")
+                status_color = {"HIT": "🟢", "STALE": "🟡", "MISS": "🔴"}.get(
+                    cache_status, "⚪"
                 )
+                st.metric("Cache Status", f"{status_color} {cache_status}")
+
+            with metric_col2:
+                if cache_info:
+                    source = cache_info.get("cache_source", "N/A").upper()
+                    st.metric("Cache Source", source)
+
+            with metric_col3:
+                response_time = response.headers.get("X-Response-Time-Ms", "0")
+                st.metric("Response Time", f"{float(response_time):.2f}ms")
+
+            with metric_col4:
+                st.metric("Matching Records", total)
+
+            if not data and total:
+                st.info(f"Page {page} is past the last page of results")
+
+            if cache_info and cache_info.get("cache_source") == "redis":
+                redis_host = cache_info.get("redis_host")
+                redis_port = cache_info.get("redis_port")
+                st.info(f"Redis: {redis_host}:{redis_port}")
+
+            st.dataframe(
+                [
+                    {
+                        "ID": item.get("word_id"),
+                        "Word": item.get("word"),
+                        "Synonyms": item.get("synonyms"),
+                    }
+                    for item in data
+                ],
+                use_container_width=True,
+                hide_index=True,
+            )
 
     st.markdown("---")
     st.caption("Built with FastAPI, SQLAlchemy, Redis, and Streamlit")
 
+    # Keep redrawing the stats from the server push. Any widget interaction
+    # reruns the script, which ends this loop and starts a fresh one.
+    if live:
+        try:
+            for stats in stream_stats():
+                with stats_placeholder.container():
+                    render_stats(stats)
+        except requests.exceptions.RequestException as e:
+            st.error(f"Live updates disconnected: {e}")
+
 
 if __name__ == "__main__":
     main()
@@ -1,9 +1,52 @@
 import pytest
 from fastapi.testclient import TestClient
 
+from app.cache.factory import CacheFactory
+from app.cache.memory_cache import MemoryCache
+from app.database.repository import SynonymRepository
 from app.main import app
+from app.models.synonym import Synonym
+from app.services import synonym_service
+from app.services.resilience import AdmissionController, CircuitBreaker
+from app.services.synonym_service import SynonymService
 
 
 @pytest.fixture
 def client():
     return TestClient(app)
+
+
+@pytest.fixture
+def synonym_rows(monkeypatch):
+    """Serve one known row from the repository instead of querying the DB."""
+    rows = [{"word_id": 1, "word": "happy", "synonyms": "joyful, cheerful"}]
+    monkeypatch.setattr(
+        SynonymRepository, "get_all", lambda self: [Synonym(**row) for row in rows]
+    )
+    return rows
+
+
+@pytest.fixture
+def isolated_cache(monkeypatch):
+    """
+    Fresh memory cache, breaker, DB slots and last known good data.
+
+    The breaker opens after one failure and there is a single DB slot with a
+    short queue timeout, so tests can trip either without waiting.
+    """
+    cache = MemoryCache()
+    monkeypatch.setattr(CacheFactory, "_instance", cache)
+    monkeypatch.setattr(
+        synonym_service,
+        "db_breaker",
+        CircuitBreaker(failure_threshold=1, reset_timeout=30),
+    )
+    monkeypatch.setattr(
+        synonym_service,
+        "db_admission",
+        AdmissionController(max_concurrent=1, queue_timeout=0.01),
+    )
+    monkeypatch.setattr(SynonymService, "_last_known_good", None)
+    for counter in ("_hits", "_stale_hits", "_misses"):
+        monkeypatch.setattr(SynonymService, counter, 0)
+    return cache
@@ -1,5 +1,9 @@
+import json
 import time
 
+from app.database.repository import SynonymRepository
+from app.services.synonym_service import CURRENT_GENERATION_KEY
+
 
 def test_root_endpoint(client):
     """Test the root endpoint returns OK"""
@@ -143,3 +147,84 @@ def test_cache_metadata_includes_source_info(client):
         if cache_info["cache_source"] == "redis":
             assert "redis_host" in cache_info
             assert "redis_port" in cache_info
+
+
+def test_stats_endpoint(client):
+    """Test the stats endpoint reports cache state without the synonym payload"""
+    client.get("/api/synonyms")
+
+    response = client.get("/api/stats")
+    assert response.status_code == 200
+    data = response.json()
+
+    assert data["cache_state"] == "warm"
+    assert data["record_count"] == 20
+    assert isinstance(data["data_version"], int)
+    assert 0 < data["ttl_remaining_seconds"] <= data["cache_ttl_seconds"]
+    assert 0.0 <= data["hit_ratio"] <= 1.0
+    assert data["circuit_state"] == "closed"
+
+
+def test_synonyms_search_and_pagination(client):
+    """Test server-side search and paging, with the match count in a header"""
+    response = client.get("/api/synonyms", params={"search": "O"})
+    assert response.status_code == 200
+    matches = response.json()
+    assert all("o" in item["word"] for item in matches)
+    assert int(response.headers["X-Total-Count"]) == len(matches)
+
+    response = client.get("/api/synonyms", params={"offset": 5, "limit": 3})
+    assert response.status_code == 200
+    assert len(response.json()) == 3
+    assert response.headers["X-Total-Count"] == "20"
+
+
+def test_stats_count_stale_responses_as_cache_hits(
+    isolated_cache, synonym_rows, client, monkeypatch
+):
+    """Test that stale fallbacks count towards the hit ratio, not as misses"""
+    client.get("/api/synonyms")
+    client.get("/api/synonyms")
+
+    def fail(self):
+        raise RuntimeError("database down")
+
+    isolated_cache.delete(CURRENT_GENERATION_KEY)
+    monkeypatch.setattr(SynonymRepository, "get_all", fail)
+    stale = client.get("/api/synonyms").json()
+    assert stale[0]["cache_metadata"]["stale"] is True
+
+    data = client.get("/api/stats").json()
+    assert (data["hits"], data["stale_hits"], data["misses"]) == (1, 1, 1)
+    assert data["hit_ratio"] == 2 / 3
+    assert data["circuit_state"] == "open"
+
+
+def test_empty_page_still_reports_cache_status(isolated_cache, synonym_rows, client):
+    """Test that the cache outcome comes in headers, not only on the rows"""
+    miss = client.get("/api/synonyms", params={"search": "zzz"})
+    assert miss.json() == []
+    assert miss.headers["X-Total-Count"] == "0"
+    assert miss.headers["X-Cache-Status"] == "MISS"
+    assert float(miss.headers["X-Response-Time-Ms"]) >= 0
+
+    hit = client.get("/api/synonyms", params={"search": "zzz"})
+    assert hit.headers["X-Cache-Status"] == "HIT"
+
+
+def test_stats_stream_sends_sse_frames(isolated_cache, client):
+    """Test that the stream sends stats as SSE event/data frames"""
+    with client.stream(
+        "GET", "/api/stats/stream", params={"max_events": 1}
+    ) as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+
+        lines = response.iter_lines()
+        assert next(lines) == "event: stats"
+        data_line = next(lines)
+
+    assert data_line.startswith("data: ")
+    stats = json.loads(data_line[len("data: ") :])
+    assert stats["cache_state"] == "empty"
+    assert stats["hit_ratio"] == 0.0
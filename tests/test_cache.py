@@ -0,0 +1,149 @@
+import threading
+
+import pytest
+
+from app.cache.memory_cache import MemoryCache
+from app.database.repository import SynonymRepository
+from app.models.synonym import Synonym
+from app.services import synonym_service
+from app.services.resilience import AdmissionController
+from app.services.synonym_service import (
+    CURRENT_GENERATION_KEY,
+    SynonymService,
+    generation_key,
+)
+
+OLD_ROWS = [{"word_id": 1, "word": "old", "synonyms": "x"}]
+NEW_ROWS = [{"word_id": 1, "word": "new", "synonyms": "x"}]
+
+
+@pytest.fixture
+def slow_load(isolated_cache, monkeypatch):
+    """
+    Start a load whose DB read returns OLD_ROWS and blocks until released.
+
+    Any other load reads NEW_ROWS straight away, like a query that started
+    after the table was updated.
+    """
+    monkeypatch.setattr(
+        synonym_service,
+        "db_admission",
+        AdmissionController(max_concurrent=2, queue_timeout=1),
+    )
+    started = threading.Event()
+    release = threading.Event()
+
+    def get_all(self):
+        if threading.current_thread() is thread:
+            started.set()
+            release.wait(timeout=5)
+            return [Synonym(**row) for row in OLD_ROWS]
+        return [Synonym(**row) for row in NEW_ROWS]
+
+    monkeypatch.setattr(SynonymRepository, "get_all", get_all)
+    thread = threading.Thread(target=SynonymService(None).get_all)
+    thread.start()
+    started.wait(timeout=5)
+
+    def finish():
+        release.set()
+        thread.join(timeout=5)
+
+    yield finish
+    finish()
+
+
+def test_memory_cache_incr_counts_from_zero():
+    """Test that incr starts at 1 and keeps counting on the same key"""
+    cache = MemoryCache()
+    assert cache.incr("counter") == 1
+    assert cache.incr("counter") == 2
+    assert cache.get("counter") == 2
+
+
+def test_memory_cache_incr_never_expires():
+    """Test that counters survive even though other keys use a TTL"""
+    cache = MemoryCache()
+    cache.incr("counter")
+    cache.set("data", "value", ttl=-1)
+    assert cache.get("data") is None
+    assert cache.exists("counter")
+
+
+def test_memory_cache_set_max_only_moves_forward():
+    """Test that set_max ignores lower values and keeps the current one"""
+    cache = MemoryCache()
+    assert cache.set_max("pointer", 3, ttl=25) == 3
+    assert cache.set_max("pointer", 2, ttl=25) == 3
+    assert cache.set_max("pointer", 5, ttl=25) == 5
+    assert cache.get("pointer") == 5
+
+
+def test_load_publishes_generation_and_flips_pointer(isolated_cache, synonym_rows):
+    """Test that a load lands under synonyms:v{N}:* and readers follow the pointer"""
+    service = SynonymService(None)
+    miss = service.get_all()
+    assert miss[0].cache_metadata.from_cache is False
+
+    assert isolated_cache.get(generation_key(1)) == synonym_rows
+    assert isolated_cache.get(generation_key(1, "count")) == 1
+    assert isolated_cache.get(CURRENT_GENERATION_KEY) == 1
+
+    hit = service.get_all()
+    assert hit[0].cache_metadata.from_cache is True
+    assert [item.word for item in hit] == ["happy"]
+
+
+def test_publish_collects_generation_before_last(isolated_cache, synonym_rows):
+    """Test that each publish keeps the previous generation and drops the one before"""
+    service = SynonymService(None)
+    for _ in range(3):
+        assert service._publish(service._reserve_generation(), synonym_rows)
+
+    assert isolated_cache.get(CURRENT_GENERATION_KEY) == 3
+    assert isolated_cache.get(generation_key(1)) is None
+    assert isolated_cache.get(generation_key(1, "count")) is None
+    assert isolated_cache.get(generation_key(2)) == synonym_rows
+
+
+def test_slower_older_load_cannot_replace_newer(isolated_cache, slow_load):
+    """Test that a load that started first but finished last is discarded"""
+    service = SynonymService(None)
+
+    # The slow load took generation 1 before querying, this one gets 2
+    newer = service.get_all()
+    assert [item.word for item in newer] == ["new"]
+    slow_load()
+
+    assert isolated_cache.get(CURRENT_GENERATION_KEY) == 2
+    assert isolated_cache.get(generation_key(1)) is None
+    assert isolated_cache.get(generation_key(2)) == NEW_ROWS
+    assert SynonymService._get_last_known_good() == NEW_ROWS
+    assert [item.word for item in service.get_all()] == ["new"]
+
+
+def test_load_started_before_invalidate_is_discarded(isolated_cache, slow_load):
+    """Test that invalidating mid-load doesn't bring the old data back"""
+    SynonymService.invalidate()
+    slow_load()
+
+    assert isolated_cache.get(generation_key(1)) is None
+    assert SynonymService._get_last_known_good() is None
+
+    reloaded = SynonymService(None).get_all()
+    assert reloaded[0].cache_metadata.from_cache is False
+    assert [item.word for item in reloaded] == ["new"]
+
+
+def test_invalidate_endpoint_forces_reload(isolated_cache, synonym_rows, client):
+    """Test that DELETE /api/cache empties the cache and the next read is a miss"""
+    client.get("/api/synonyms")
+    hit = client.get("/api/synonyms").json()
+    assert hit[0]["cache_metadata"]["from_cache"] is True
+
+    response = client.delete("/api/cache")
+    assert response.status_code == 200
+    assert client.get("/api/stats").json()["cache_state"] == "empty"
+
+    reloaded = client.get("/api/synonyms").json()
+    assert reloaded[0]["cache_metadata"]["from_cache"] is False
@@ -0,0 +1,32 @@
+import pytest
+from pydantic import ValidationError
+
+from app.config import DatabaseBackend, Settings
+
+BASE_SETTINGS = {
+    "redis_host": "localhost",
+    "redis_port": 6379,
+    "redis_db": 0,
+    "cache_strategy": "memory",
+    "cache_ttl": 25,
+}
+
+
+def test_sqlite_backend_needs_no_sql_server_settings(monkeypatch):
+    """Test that edge nodes can run on SQLite without SQL Server settings"""
+    for name in ("DATABASE_SERVER", "DATABASE_USER", "DATABASE_PASSWORD"):
+        monkeypatch.delenv(name, raising=False)
+
+    config = Settings(
+        **BASE_SETTINGS, database_backend="sqlite", sqlite_path="/data/syn.db"
+    )
+    assert config.database_backend == DatabaseBackend.SQLITE
+    assert config.database_url == "sqlite:///file:/data/syn.db?mode=ro&uri=true"
+
+
+def test_mssql_backend_requires_sql_server_settings(monkeypatch):
+    """Test that the default backend still fails fast on missing settings"""
+    monkeypatch.delenv("DATABASE_SERVER", raising=False)
+
+    with pytest.raises(ValidationError, match="database_server"):
+        Settings(**BASE_SETTINGS, database_backend="mssql")
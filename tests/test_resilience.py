@@ -0,0 +1,154 @@
+import threading
+import time
+
+import pytest
+
+from app.database.repository import SynonymRepository
+from app.services import synonym_service
+from app.services.resilience import (
+    AdmissionController,
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    ServiceOverloadedError,
+)
+from app.services.synonym_service import CURRENT_GENERATION_KEY, SynonymService
+
+
+def _fail(*args):
+    raise RuntimeError("database down")
+
+
+def test_admission_sheds_when_all_slots_busy():
+    """Test that a request is rejected once it waits longer than the queue timeout"""
+    admission = AdmissionController(max_concurrent=1, queue_timeout=0.05)
+    holding = threading.Event()
+    release = threading.Event()
+
+    def hold_slot():
+        with admission.admit():
+            holding.set()
+            release.wait()
+
+    worker = threading.Thread(target=hold_slot)
+    worker.start()
+    holding.wait()
+
+    with pytest.raises(ServiceOverloadedError) as exc_info:
+        with admission.admit():
+            pass
+    assert exc_info.value.retry_after_header == "1"
+
+    release.set()
+    worker.join()
+
+    # Slot is free again after the holder finishes
+    with admission.admit():
+        pass
+
+
+def test_breaker_opens_after_threshold_and_fails_fast():
+    """Test that the breaker opens after repeated failures and skips the call"""
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            breaker.call(_fail)
+    assert breaker.state == CircuitState.OPEN
+
+    calls = []
+    with pytest.raises(CircuitOpenError) as exc_info:
+        breaker.call(lambda: calls.append(1))
+    assert calls == []
+    assert int(exc_info.value.retry_after_header) <= 30
+
+
+def test_breaker_half_open_trial_closes_on_success():
+    """Test that a successful trial call after the reset timeout closes the breaker"""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+
+    with pytest.raises(RuntimeError):
+        breaker.call(_fail)
+    assert breaker.state == CircuitState.OPEN
+
+    time.sleep(0.06)
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert breaker.call(lambda: "ok") == "ok"
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_breaker_half_open_trial_reopens_on_failure():
+    """Test that a failed trial call re-opens the breaker"""
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=0.05)
+
+    for _ in range(3):
+        with pytest.raises(RuntimeError):
+            breaker.call(_fail)
+
+    time.sleep(0.06)
+    with pytest.raises(RuntimeError):
+        breaker.call(_fail)
+    assert breaker.state == CircuitState.OPEN
+
+
+def test_service_serves_stale_when_db_fails_after_expiry(
+    isolated_cache, synonym_rows, monkeypatch
+):
+    """Test that last known good data is served, flagged stale, once the DB fails"""
+    service = SynonymService(None)
+    service.get_all()
+
+    # Expire the cached dataset, then take the database down
+    isolated_cache.delete(CURRENT_GENERATION_KEY)
+    monkeypatch.setattr(SynonymRepository, "get_all", _fail)
+
+    result = service.get_all()
+    assert [item.word for item in result] == ["happy"]
+    assert result[0].cache_metadata.from_cache is True
+    assert result[0].cache_metadata.stale is True
+    assert synonym_service.db_breaker.state == CircuitState.OPEN
+
+
+def test_service_skips_db_slot_while_breaker_open(
+    isolated_cache, synonym_rows, monkeypatch
+):
+    """Test that an open breaker serves stale data without queueing for the DB"""
+    service = SynonymService(None)
+    service.get_all()
+    isolated_cache.delete(CURRENT_GENERATION_KEY)
+    synonym_service.db_breaker.record_failure()
+
+    calls = []
+    monkeypatch.setattr(SynonymRepository, "get_all", lambda self: calls.append(1))
+
+    # With every slot taken, queueing would shed the request with a 503
+    synonym_service.db_admission._slots.acquire()
+    try:
+        result = service.get_all()
+    finally:
+        synonym_service.db_admission._slots.release()
+
+    assert result[0].cache_metadata.stale is True
+    assert calls == []
+
+
+def test_synonyms_returns_503_when_breaker_open_without_stale(isolated_cache, client):
+    """Test that an open breaker with nothing to fall back on fails fast"""
+    synonym_service.db_breaker.record_failure()
+
+    response = client.get("/api/synonyms")
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "30"
+
+
+def test_synonyms_returns_503_when_shed(isolated_cache, synonym_rows, client):
+    """Test that a request that can't get a DB slot in time is shed"""
+
+    synonym_service.db_admission._slots.acquire()
+    try:
+        response = client.get("/api/synonyms")
+    finally:
+        synonym_service.db_admission._slots.release()
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
@@ -0,0 +1,97 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from app.config import settings
+from app.database import sync
+from app.database.connection import create_sqlite_engine
+from app.database.repository import SynonymRepository
+from app.models.synonym import Synonym
+
+
+@pytest.fixture
+def sqlite_file(tmp_path, monkeypatch):
+    """Point the SQLite backend at a temp file and SQL Server at a stub."""
+    path = tmp_path / "edge" / "synonyms.db"
+    monkeypatch.setattr(settings, "sqlite_path", str(path))
+    for name in settings.missing_mssql_settings():
+        monkeypatch.setattr(settings, name, "stub")
+    monkeypatch.setattr(sync, "create_mssql_engine", lambda: create_engine("sqlite://"))
+    return path
+
+
+def _source_rows(monkeypatch, rows):
+    monkeypatch.setattr(
+        SynonymRepository, "get_all", lambda self: [Synonym(**row) for row in rows]
+    )
+
+
+def _read_words(path):
+    engine = create_engine(f"sqlite:///{path}")
+    with engine.connect() as conn:
+        words = conn.execute(text("SELECT word FROM synonyms ORDER BY word_id"))
+        return [row[0] for row in words]
+
+
+def test_sync_replaces_table_in_wal_mode(sqlite_file, monkeypatch):
+    """Test that each sync replaces the whole table and leaves the file in WAL"""
+    _source_rows(monkeypatch, [{"word_id": 1, "word": "old", "synonyms": "x"}])
+    assert sync.sync() == 1
+
+    _source_rows(
+        monkeypatch,
+        [
+            {"word_id": 1, "word": "happy", "synonyms": "glad"},
+            {"word_id": 2, "word": "sad", "synonyms": "blue"},
+        ],
+    )
+    assert sync.sync() == 2
+    assert _read_words(sqlite_file) == ["happy", "sad"]
+
+    with create_engine(f"sqlite:///{sqlite_file}").connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+
+
+def test_sync_failure_keeps_previous_dataset(sqlite_file, monkeypatch):
+    """Test that a failed sync rolls back instead of leaving a partial table"""
+    _source_rows(monkeypatch, [{"word_id": 1, "word": "happy", "synonyms": "x"}])
+    sync.sync()
+
+    # Duplicate primary keys make the insert fail after the delete ran
+    _source_rows(
+        monkeypatch,
+        [
+            {"word_id": 5, "word": "new", "synonyms": "x"},
+            {"word_id": 5, "word": "dup", "synonyms": "x"},
+        ],
+    )
+    with pytest.raises(IntegrityError):
+        sync.sync()
+    assert _read_words(sqlite_file) == ["happy"]
+
+
+def test_sync_requires_sql_server_settings(sqlite_file, monkeypatch):
+    """Test that sync fails with a clear error when SQL Server isn't configured"""
+    monkeypatch.setattr(settings, "database_server", None)
+
+    with pytest.raises(ValueError, match="database_server"):
+        sync.sync()
+
+
+def test_sqlite_engine_is_read_only_and_memory_mapped(sqlite_file, monkeypatch):
+    """Test that app connections are read-only with mmap enabled"""
+    _source_rows(monkeypatch, [{"word_id": 1, "word": "happy", "synonyms": "x"}])
+    sync.sync()
+
+    engine = create_sqlite_engine()
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA query_only").scalar() == 1
+        assert (
+            conn.exec_driver_sql("PRAGMA mmap_size").scalar()
+            == settings.sqlite_mmap_size
+        )
+        assert conn.exec_driver_sql("SELECT count(*) FROM synonyms").scalar() == 1
+
+        with pytest.raises(OperationalError, match="readonly"):
+            conn.exec_driver_sql("DELETE FROM synonyms")
+    engine.dispose()